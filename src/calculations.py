@@ -1,10 +1,16 @@
 import math
+from array import array
 from constants import G, EARTH_MASS, AU_TO_M, DAYS_PER_YEAR, MAX_WAIT_YEARS, INITIAL_TIME_YEARS
 
 def calculate_escape_velocity(mass_kg, radius_m):
     """Calculate escape velocity in m/s given mass in kg and radius in m."""
     return math.sqrt((2 * G * mass_kg) / radius_m)
 
+def compute_escape_velocities(masses_kg, radii_m):
+    """Calculate escape velocities in m/s for sequences of masses in kg and radii in m, as an array."""
+    two_g = 2 * G
+    return array('d', [math.sqrt(two_g * mass_kg / radius_m) for mass_kg, radius_m in zip(masses_kg, radii_m)])
+
 def parse_mass(mass_str):
     """Parse mass string to kg, handling kg or Earth mass units."""
     mass_str = mass_str.strip()
@@ -23,14 +29,18 @@ def parse_mass(mass_str):
     else:
         return float(mass_str.split()[0]) * EARTH_MASS
 
+def compute_stage_two_table(planet_data, a):
+    """Compute Stage Two data for a whole catalog as columns: (planets, v_escape_m_s, t_s, d_m)."""
+    planets = list(planet_data)
+    v_escape_m_s = array('d', [data[2] for data in planet_data.values()])
+    t_s = array('d', [v / a for v in v_escape_m_s])
+    d_m = array('d', [0.5 * a * t**2 for t in t_s])
+    return planets, v_escape_m_s, t_s, d_m
+
 def compute_stage_two_data(planet_data, a):
     """Compute Stage Two data: {planet: (v_escape_m_s, t_s, d_m)}."""
-    results = {}
-    for planet, (radius_km, mass_kg, v_escape_m_s) in planet_data.items():
-        t_s = v_escape_m_s / a
-        d_m = 0.5 * a * t_s**2
-        results[planet] = (v_escape_m_s, t_s, d_m)
-    return results
+    planets, v_escape_m_s, t_s, d_m = compute_stage_two_table(planet_data, a)
+    return {planet: row for planet, row in zip(planets, zip(v_escape_m_s, t_s, d_m))}
 
 def compute_travel_parameters(start, dest, planet_data, orbit_data, a, t_launch_days=None):
     """Compute travel parameters from start to dest planet (Stage Three/Five/Six)."""
@@ -66,6 +76,40 @@ def compute_travel_parameters(start, dest, planet_data, orbit_data, a, t_launch_
 
     return t_acc_s, h_acc_m, t_cruise_s, h_dec_m, t_dec_s, t_total_s
 
+def iter_travel_parameter_blocks(planet_data, orbit_data, a, block_size=256):
+    """Compute the pairwise Stage Three matrix in row blocks.
+
+    Yields (start_planets, dest_planets, D_m, t_acc_s, t_cruise_s, t_dec_s) where each
+    matrix is a list of array rows, one per start planet in the block, so at most
+    block_size x N values per column are held in memory at once. Values match
+    compute_travel_parameters with static orbits.
+    """
+    planets = [planet for planet in planet_data if planet in orbit_data]
+    r_orbit_m = [orbit_data[planet][1] * AU_TO_M for planet in planets]
+    r_body_m = [planet_data[planet][0] * 1000 for planet in planets]
+    v_escape_m_s = [planet_data[planet][2] for planet in planets]
+    inv_a = 1.0 / a
+
+    for block_start in range(0, len(planets), block_size):
+        block_end = min(block_start + block_size, len(planets))
+        D_rows, t_acc_rows, t_cruise_rows = [], [], []
+        for i in range(block_start, block_end):
+            r_orbit_i = r_orbit_m[i]
+            r_body_i = r_body_m[i]
+            v_i = v_escape_m_s[i]
+            v_cruise = [v_i if v_i > v_j else v_j for v_j in v_escape_m_s]
+            D_row = array('d', [abs(r_j - r_orbit_i) for r_j in r_orbit_m])
+            # Cruise distance: D - r_start - r_dest - h_acc - h_dec, with h_acc + h_dec = v^2 / a
+            t_cruise_row = array('d', [
+                max(0.0, D - r_body_i - r_body_j - v * v * inv_a) / v
+                for D, r_body_j, v in zip(D_row, r_body_m, v_cruise)
+            ])
+            D_rows.append(D_row)
+            t_acc_rows.append(array('d', [v * inv_a for v in v_cruise]))
+            t_cruise_rows.append(t_cruise_row)
+        # Deceleration mirrors acceleration
+        yield planets[block_start:block_end], planets, D_rows, t_acc_rows, t_cruise_rows, t_acc_rows
+
 def compute_travel_time(start, dest, planet_data, orbit_data, a, t_launch_days):
     """Helper function to compute total travel time in days for dynamic simulation."""
     params = compute_travel_parameters(start, dest, planet_data, orbit_data, a, t_launch_days)
@@ -216,41 +260,33 @@ def compute_dynamic_transfer_window(start, dest, planet_data, orbit_data, a, ste
     params = compute_travel_parameters(start, dest, planet_data, orbit_data, a, optimal_t_days)
     return optimal_t_days, params
 
-def compute_rocket_trajectory(start, dest, planet_data, orbit_data, a, t_launch_days):
-    """Compute rocket's position over time from launch to destination."""
-    from constants import AU_TO_M
+def compute_planet_positions(orbit_data, t_days):
+    """Compute heliocentric (x, y) positions in m for all planets at time t_days."""
+    positions = {}
+    for planet, (period_days, r_orbit_au) in orbit_data.items():
+        theta = math.radians((360.0 / period_days * t_days) % 360)
+        r = r_orbit_au * AU_TO_M
+        positions[planet] = (r * math.cos(theta), r * math.sin(theta))
+    return positions
+
+def compute_rocket_path(start, dest, planet_data, orbit_data, a, t_launch_days):
+    """Compute the rocket's straight-line path: (t_launch_days, t_end_days, (x_start, y_start), (x_dest, y_dest))."""
     t_travel_days = compute_travel_time(start, dest, planet_data, orbit_data, a, t_launch_days)
     t_end_days = t_launch_days + t_travel_days
-    step_size = max(0.1, t_travel_days / 100)  # At least 100 steps for smooth animation
 
     theta_start_launch = math.radians((360.0 / orbit_data[start][0] * t_launch_days) % 360)
     theta_dest_end = math.radians((360.0 / orbit_data[dest][0] * t_end_days) % 360)
     r_start = orbit_data[start][1] * AU_TO_M
     r_dest = orbit_data[dest][1] * AU_TO_M
 
-    x_start = r_start * math.cos(theta_start_launch)
-    y_start = r_start * math.sin(theta_start_launch)
-    x_dest = r_dest * math.cos(theta_dest_end)
-    y_dest = r_dest * math.sin(theta_dest_end)
-
-    trajectory = []
-    for t in [t_launch_days + i * step_size for i in range(int(t_travel_days / step_size) + 1)]:
-        f = (t - t_launch_days) / t_travel_days if t_travel_days > 0 else 0
-        f = min(f, 1.0)
-        x_rocket = x_start + f * (x_dest - x_start)
-        y_rocket = y_start + f * (y_dest - y_start)
-        trajectory.append((t, x_rocket, y_rocket))
-    
-    # Include planetary positions at each step
-    all_positions = {}
-    for planet in orbit_data:
-        positions = []
-        for t in [t_launch_days + i * step_size for i in range(int(t_travel_days / step_size) + 1)]:
-            theta = math.radians((360.0 / orbit_data[planet][0] * t) % 360)
-            r = orbit_data[planet][1] * AU_TO_M
-            x = r * math.cos(theta)
-            y = r * math.sin(theta)
-            positions.append((x, y))
-        all_positions[planet] = positions
-    
-    return trajectory, all_positions, t_launch_days, t_end_days
\ No newline at end of file
+    start_xy = (r_start * math.cos(theta_start_launch), r_start * math.sin(theta_start_launch))
+    dest_xy = (r_dest * math.cos(theta_dest_end), r_dest * math.sin(theta_dest_end))
+    return t_launch_days, t_end_days, start_xy, dest_xy
+
+def compute_rocket_position(path, t_days):
+    """Compute the rocket's (x, y) position in m at time t_days along a path from compute_rocket_path."""
+    t_launch_days, t_end_days, (x_start, y_start), (x_dest, y_dest) = path
+    t_travel_days = t_end_days - t_launch_days
+    f = (t_days - t_launch_days) / t_travel_days if t_travel_days > 0 else 0
+    f = max(0.0, min(f, 1.0))
+    return x_start + f * (x_dest - x_start), y_start + f * (y_dest - y_start)
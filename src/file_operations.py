@@ -1,6 +1,6 @@
 import os
 import re
-from calculations import calculate_escape_velocity, parse_mass
+from calculations import compute_escape_velocities, iter_travel_parameter_blocks, parse_mass
 
 def read_rocket_data(file_path):
     """Read rocket data and return total acceleration in m/s^2."""
@@ -23,6 +23,7 @@ def read_planetary_data(file_path):
     if not os.path.exists(file_path):
         print(f">> Error: '{file_path}' not found!")
         return planet_data
+    parsed = {}
     try:
         with open(file_path, 'r') as file:
             for line in file:
@@ -31,16 +32,17 @@ def read_planetary_data(file_path):
                 match = re.match(r'(\w+):\s*diameter\s*=\s*([\d.]+)\s*km,\s*mass\s*=\s*([^,]+)', line.strip())
                 if match:
                     planet, diam_str, mass_str = match.groups()
-                    radius_km = float(diam_str) / 2
-                    radius_m = radius_km * 1000
-                    mass_kg = parse_mass(mass_str)
-                    v_escape_m_s = calculate_escape_velocity(mass_kg, radius_m)
-                    planet_data[planet] = (radius_km, mass_kg, v_escape_m_s)
+                    parsed[planet] = (float(diam_str) / 2, parse_mass(mass_str))
                 else:
                     print(f">> Error: Invalid line in '{file_path}': {line.strip()}")
     except IOError as e:
         print(f">> Error: Unable to read '{file_path}': {str(e)}")
         return None
+    # Escape velocities for the whole catalog in one pass
+    v_escape = compute_escape_velocities([mass_kg for _, mass_kg in parsed.values()],
+                                         [radius_km * 1000 for radius_km, _ in parsed.values()])
+    for (planet, (radius_km, mass_kg)), v_escape_m_s in zip(parsed.items(), v_escape):
+        planet_data[planet] = (radius_km, mass_kg, v_escape_m_s)
     return planet_data
 
 def read_solar_system_data(file_path):
@@ -62,3 +64,17 @@ def read_solar_system_data(file_path):
         print(f">> Error: Unable to read '{file_path}': {str(e)}")
         return orbit_data
     return orbit_data
+
+def write_travel_matrix(file_path, planet_data, orbit_data, a, block_size=256):
+    """Stream the pairwise Stage Three matrix to a CSV file one row block at a time."""
+    try:
+        with open(file_path, 'w') as file:
+            file.write("start,destination,distance_m,t_acc_s,t_cruise_s,t_dec_s\n")
+            for starts, dests, D_rows, t_acc_rows, t_cruise_rows, t_dec_rows in iter_travel_parameter_blocks(planet_data, orbit_data, a, block_size):
+                for start, D_row, t_acc_row, t_cruise_row, t_dec_row in zip(starts, D_rows, t_acc_rows, t_cruise_rows, t_dec_rows):
+                    file.writelines(f"{start},{dest},{D:.6e},{t_acc:.6e},{t_cruise:.6e},{t_dec:.6e}\n"
+                                    for dest, D, t_acc, t_cruise, t_dec in zip(dests, D_row, t_acc_row, t_cruise_row, t_dec_row))
+    except IOError as e:
+        print(f">> Error: Unable to write '{file_path}': {str(e)}")
+        return False
+    return True
@@ -1,8 +1,22 @@
+import time
 import tkinter as tk
+from collections import OrderedDict
 from tkinter import ttk, messagebox
 from main import run_stage_two, run_stage_three, run_stage_four, run_stage_five, run_stage_six
+from calculations import compute_planet_positions, compute_rocket_position
 from constants import AU_TO_M
 
+CANVAS_WIDTH = 600
+CANVAS_HEIGHT = 400
+FRAME_INTERVAL_MS = 50  # Frame budget per animation tick
+FRAME_CACHE_SIZE = 64  # Number of computed frames kept for scrubbing back and forth
+FRAME_TIME_QUANTUM_DAYS = 0.01  # Times closer than this share a cached frame
+DEFAULT_PLAYBACK_SECONDS = 5  # Default speed plays the whole transfer in this many seconds
+MIN_ZOOM = 0.5
+MAX_ZOOM = 100.0
+MIN_LABEL_ORBIT_PX = 25  # Skip labels of planets whose orbit is this small on screen
+MAX_LOD = 3  # 0: bodies, 1: + labels, 2: + orbits, 3: + rocket trail
+
 class PlanetaryTravelGUI:
     def __init__(self, root):
         self.root = root
@@ -101,8 +115,16 @@ class PlanetaryTravelGUI:
         self.stage_six_text = tk.Text(tab, height=10, width=80)
         self.stage_six_text.pack(pady=5)
 
-        self.canvas = tk.Canvas(tab, width=600, height=400, bg="black")
+        self.canvas = tk.Canvas(tab, width=CANVAS_WIDTH, height=CANVAS_HEIGHT, bg="black")
         self.canvas.pack(pady=10)
+        self.canvas.bind("<MouseWheel>", self.on_zoom)
+        self.canvas.bind("<Button-4>", self.on_zoom)
+        self.canvas.bind("<Button-5>", self.on_zoom)
+
+        self.time_var = tk.DoubleVar(value=0.0)
+        self.time_slider = ttk.Scale(tab, from_=0.0, to=1.0, orient=tk.HORIZONTAL, length=CANVAS_WIDTH,
+                                     variable=self.time_var, command=self.on_time_scrub, state="disabled")
+        self.time_slider.pack(pady=5)
 
         button_frame = ttk.Frame(tab)
         button_frame.pack(pady=5)
@@ -112,12 +134,18 @@ class PlanetaryTravelGUI:
         self.start_button.pack(side=tk.LEFT, padx=5)
         self.stop_button = ttk.Button(button_frame, text="Stop Animation", command=self.stop_animation, state="disabled")
         self.stop_button.pack(side=tk.LEFT, padx=5)
+        ttk.Label(button_frame, text="Speed (days/s):").pack(side=tk.LEFT, padx=5)
+        self.speed_six = ttk.Combobox(button_frame, width=10, values=["1", "10", "100", "1000", "10000"])
+        self.speed_six.pack(side=tk.LEFT)
 
-        self.trajectory = None
-        self.all_positions = None
+        self.rocket_path = None
         self.t_start = None
         self.t_end = None
-        self.anim_index = 0
+        self.t_current = None
+        self.frame_cache = OrderedDict()
+        self.zoom = 1.0
+        self.lod = MAX_LOD
+        self.last_tick = None
         self.animation_running = False
         self.animation_id = None
 
@@ -174,26 +202,34 @@ class PlanetaryTravelGUI:
         if start not in self.planet_data or dest not in self.planet_data:
             messagebox.showerror("Error", f"Invalid planet(s). Choose from: {list(self.planet_data.keys())}")
             return
+        self.stop_animation()
         self.stage_six_text.delete(1.0, tk.END)
         self.canvas.delete("all")
-        text_output, trajectory, all_positions, t_start, t_end = run_stage_six(start, dest, self.planet_data, self.orbit_data, self.rocket_acc)
+        self.frame_cache.clear()
+        text_output, rocket_path = run_stage_six(start, dest, self.planet_data, self.orbit_data, self.rocket_acc)
         self.stage_six_text.insert(tk.END, text_output)
-        if trajectory is not None:
-            self.trajectory = trajectory
-            self.all_positions = all_positions
-            self.t_start = t_start
-            self.t_end = t_end
-            self.anim_index = 0
+        if rocket_path is not None:
+            self.rocket_path = rocket_path
+            self.t_start, self.t_end = rocket_path[0], rocket_path[1]
+            self.t_current = self.t_start
+            self.lod = MAX_LOD
+            self.speed_six.set(f"{max(0.1, (self.t_end - self.t_start) / DEFAULT_PLAYBACK_SECONDS):.1f}")
+            self.time_slider.config(from_=self.t_start, to=self.t_end, state="normal")
+            self.time_var.set(self.t_start)
             self.start_button.config(state="normal")
             self.stop_button.config(state="disabled")
+            self.draw_frame()
         else:
+            self.rocket_path = None
+            self.time_slider.config(state="disabled")
             self.start_button.config(state="disabled")
             self.stop_button.config(state="disabled")
 
     def start_animation(self):
-        if not self.trajectory or not self.all_positions or self.animation_running:
+        if self.rocket_path is None or self.animation_running:
             return
         self.animation_running = True
+        self.last_tick = time.perf_counter()
         self.start_button.config(state="disabled")
         self.stop_button.config(state="normal")
         self.animate_rocket()
@@ -205,36 +241,97 @@ class PlanetaryTravelGUI:
             self.start_button.config(state="normal")
             self.stop_button.config(state="disabled")
 
-    def animate_rocket(self):
-        if not self.animation_running:
+    def get_playback_speed(self):
+        try:
+            speed = float(self.speed_six.get().strip())
+            return speed if speed > 0 else 0.0
+        except ValueError:
+            return 0.0
+
+    def on_time_scrub(self, value):
+        if self.rocket_path is None:
             return
+        self.t_current = float(value)
+        self.draw_frame()
 
-        self.canvas.delete("all")
-        canvas_width = 600
-        canvas_height = 400
-        scale = canvas_width / (max([data[1] for data in self.orbit_data.values()]) * AU_TO_M * 2)
+    def on_zoom(self, event):
+        if self.rocket_path is None:
+            return
+        if event.num == 4 or event.delta > 0:
+            self.zoom = min(MAX_ZOOM, self.zoom * 1.25)
+        else:
+            self.zoom = max(MIN_ZOOM, self.zoom / 1.25)
+        self.lod = MAX_LOD
+        self.draw_frame()
 
-        self.canvas.create_oval(canvas_width/2-5, canvas_height/2-5, canvas_width/2+5, canvas_height/2+5, fill="yellow")
+    def get_frame(self, t_days):
+        """Return (planet_positions, rocket_xy) at t_days, computing it on demand with a small LRU cache."""
+        key = round(t_days / FRAME_TIME_QUANTUM_DAYS)
+        frame = self.frame_cache.get(key)
+        if frame is not None:
+            self.frame_cache.move_to_end(key)
+            return frame
+        frame = (compute_planet_positions(self.orbit_data, t_days), compute_rocket_position(self.rocket_path, t_days))
+        self.frame_cache[key] = frame
+        if len(self.frame_cache) > FRAME_CACHE_SIZE:
+            self.frame_cache.popitem(last=False)
+        return frame
 
-        if self.anim_index >= len(self.trajectory):
-            self.anim_index = 0
-        t, x_rocket, y_rocket = self.trajectory[self.anim_index]
+    def draw_frame(self):
+        draw_started = time.perf_counter()
+        t = self.t_current
+        planet_positions, (x_rocket, y_rocket) = self.get_frame(t)
 
-        for planet, positions in self.all_positions.items():
-            x_planet, y_planet = positions[self.anim_index]
-            x = canvas_width/2 + x_planet * scale
-            y = canvas_height/2 - y_planet * scale
+        self.canvas.delete("all")
+        cx = CANVAS_WIDTH / 2
+        cy = CANVAS_HEIGHT / 2
+        scale = CANVAS_WIDTH / (max([data[1] for data in self.orbit_data.values()]) * AU_TO_M * 2) * self.zoom
+        start_planet = self.start_planet_six.get()
+        dest_planet = self.dest_planet_six.get()
+
+        self.canvas.create_oval(cx-5, cy-5, cx+5, cy+5, fill="yellow")
+
+        for planet, (x_planet, y_planet) in planet_positions.items():
+            r_orbit_px = self.orbit_data[planet][1] * AU_TO_M * scale
+            if self.lod >= 2:
+                self.canvas.create_oval(cx-r_orbit_px, cy-r_orbit_px, cx+r_orbit_px, cy+r_orbit_px, outline="#333333")
+            x = cx + x_planet * scale
+            y = cy - y_planet * scale
             size = max(5, min(20, self.planet_data[planet][0] * scale * 1000 / AU_TO_M * 100))
-            self.canvas.create_oval(x-size, y-size, x+size, y+size, fill="grey" if planet not in [self.start_planet_six.get(), self.dest_planet_six.get()] else "green" if planet == self.start_planet_six.get() else "red")
-            self.canvas.create_text(x, y-size-10, text=planet, fill="white")
+            if x + size < 0 or x - size > CANVAS_WIDTH or y + size < 0 or y - size > CANVAS_HEIGHT:
+                continue
+            self.canvas.create_oval(x-size, y-size, x+size, y+size, fill="grey" if planet not in [start_planet, dest_planet] else "green" if planet == start_planet else "red")
+            if self.lod >= 1 and (r_orbit_px >= MIN_LABEL_ORBIT_PX or planet in [start_planet, dest_planet]):
+                self.canvas.create_text(x, y-size-10, text=planet, fill="white")
 
-        x_r = canvas_width/2 + x_rocket * scale
-        y_r = canvas_height/2 - y_rocket * scale
+        x_r = cx + x_rocket * scale
+        y_r = cy - y_rocket * scale
+        if self.lod >= 3:
+            x_launch, y_launch = self.rocket_path[2]
+            self.canvas.create_line(cx + x_launch * scale, cy - y_launch * scale, x_r, y_r, fill="white", dash=(2, 4))
         self.canvas.create_oval(x_r-3, y_r-3, x_r+3, y_r+3, fill="white")
         self.canvas.create_text(x_r, y_r-15, text=f"t={t:.1f} days", fill="white")
 
-        self.anim_index += 1
-        self.animation_id = self.root.after(50, self.animate_rocket)
+        # Drop detail when a frame overruns the budget, restore it when there is headroom
+        draw_ms = (time.perf_counter() - draw_started) * 1000
+        if draw_ms > FRAME_INTERVAL_MS / 2 and self.lod > 0:
+            self.lod -= 1
+        elif draw_ms < FRAME_INTERVAL_MS / 8 and self.lod < MAX_LOD:
+            self.lod += 1
+
+    def animate_rocket(self):
+        if not self.animation_running:
+            return
+
+        now = time.perf_counter()
+        self.t_current += self.get_playback_speed() * (now - self.last_tick)
+        self.last_tick = now
+        if self.t_current > self.t_end:
+            self.t_current = self.t_start
+        self.time_var.set(self.t_current)
+        self.draw_frame()
+
+        self.animation_id = self.root.after(FRAME_INTERVAL_MS, self.animate_rocket)
 
 def main():
     root = tk.Tk()
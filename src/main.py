@@ -1,5 +1,5 @@
 from file_operations import read_rocket_data, read_planetary_data, read_solar_system_data
-from calculations import compute_stage_two_data, compute_travel_parameters, compute_angular_positions, compute_optimal_transfer_window, compute_dynamic_transfer_window, compute_rocket_trajectory
+from calculations import compute_stage_two_data, compute_travel_parameters, compute_angular_positions, compute_optimal_transfer_window, compute_dynamic_transfer_window, compute_rocket_path
 from display import display_stage_two_results, display_travel_parameters, display_angular_positions, display_stage_five_results, display_stage_six_results
 import io
 import sys
@@ -33,13 +33,13 @@ def run_stage_five(start, dest, planet_data, orbit_data, a):
     return capture_output(display_stage_five_results, start, dest, t_optimal_days, params, orbit_data)
 
 def run_stage_six(start, dest, planet_data, orbit_data, a):
-    """Compute and return Stage Six dynamic transfer window and trajectory data."""
+    """Compute and return Stage Six dynamic transfer window and the rocket path to animate lazily."""
     t_optimal_days, params = compute_dynamic_transfer_window(start, dest, planet_data, orbit_data, a)
     text_output = capture_output(display_stage_six_results, start, dest, t_optimal_days, params, orbit_data)
     if t_optimal_days is None:
-        return text_output, None, None, None, None
-    trajectory, all_positions, t_start, t_end = compute_rocket_trajectory(start, dest, planet_data, orbit_data, a, t_optimal_days)
-    return text_output, trajectory, all_positions, t_start, t_end
+        return text_output, None
+    rocket_path = compute_rocket_path(start, dest, planet_data, orbit_data, a, t_optimal_days)
+    return text_output, rocket_path
 
 if __name__ == "__main__":
     print("This module is intended to be imported by gui.py. Please run gui.py to launch the application.")
\ No newline at end of file